@@ -6,17 +6,29 @@ from dotenv import load_dotenv
 import random
 import json
 import asyncio
+import time
 # Loads the Bots Token from .env file
 load_dotenv()
 TOKEN = os.getenv("bot_token")
 
 # Create a bot with a prefix for commands
 bot = commands.Bot(command_prefix="!", intents=discord.Intents.all())
+bot.boot_started = time.perf_counter()
+bot.in_flight = set()  # Tasks that shutdown waits for before closing
+bot.warm_state = {}  # Per-cog snapshot from the previous run, filled in main()
 
 # +----------------------+
 # |  LISTS, TUPLES, ETC  |
 # +----------------------+
-from modules.utils import disc_colors
+from modules.utils import disc_colors, load_warm_state, save_warm_state
+
+EXTENSIONS = (
+    "modules.fun",
+    "modules.rolls",
+    "modules.admin",
+    "modules.events",
+    "modules.rolepicker",
+)
 
 # +--------------+
 # |  BOT EVENTS  |
@@ -24,7 +36,15 @@ from modules.utils import disc_colors
 
 @bot.event
 async def on_ready():
-    print(f"✅ Logged in as {bot.user}")
+    print(f"✅ Logged in as {bot.user} ({time.perf_counter() - bot.boot_started:.2f}s after boot)")
+
+@bot.before_invoke
+async def track_command_start(ctx):
+    bot.in_flight.add(asyncio.current_task())
+
+@bot.after_invoke
+async def track_command_end(ctx):
+    bot.in_flight.discard(asyncio.current_task())
 
 
 # +----------------+
@@ -46,11 +66,20 @@ async def colortest(ctx):
 
 if __name__ == "__main__":
     async def main():
-        await bot.load_extension("modules.fun")
-        await bot.load_extension("modules.rolls")
-        await bot.load_extension("modules.admin")
-        await bot.load_extension("modules.events")
-        await bot.load_extension("modules.rolepicker")
-        await bot.start(TOKEN)
+        bot.warm_state = load_warm_state()
+        for name in EXTENSIONS:
+            start = time.perf_counter()
+            try:
+                await bot.load_extension(name)
+            except Exception as e:
+                # Keep going so one broken cog doesn't take the rest down with it
+                print(f"❌ Failed to load {name}: {e}")
+                continue
+            print(f"🧩 Loaded {name} in {(time.perf_counter() - start) * 1000:.1f}ms")
+        try:
+            await bot.start(TOKEN)
+        finally:
+            # Runs on !shutdown as well as on crashes/Ctrl+C
+            save_warm_state(bot)
 
     asyncio.run(main())
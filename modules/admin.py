@@ -1,4 +1,5 @@
 from discord.ext import commands
+from modules.utils import drain_in_flight
 
 class Admin(commands.Cog):
     def __init__(self, bot):
@@ -8,6 +9,9 @@ class Admin(commands.Cog):
     @commands.is_owner()  # Only the bot owner can use this command
     async def shutdown(self, ctx):
         await ctx.send("Shutting down gracefully...")
+        # Let in-flight commands and reaction handlers finish; the warm-start
+        # snapshot is written by bot.py once the bot has closed
+        await drain_in_flight(self.bot)
         await self.bot.close()
 
 
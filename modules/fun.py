@@ -1,38 +1,181 @@
 from discord.ext import commands
+import json
+import os
+import time
 import random
+import logging
+
+DEFAULT_COOLDOWNS = {
+    "channel": {"rate": 5, "per": 10},
+    "user": {"rate": 2, "per": 5}
+}
+
+class FunConfigError(ValueError):
+    """Raised when data/fun_commands.json can't be loaded; the current registry is kept."""
+
+class ShuffleBag:
+    """Hands out every item once in random order before reshuffling, never repeating back to back."""
+    def __init__(self, items):
+        self.items = list(items)
+        self._bag = []
+        self._last = None
+
+    def pick(self):
+        if not self._bag:
+            self._bag = self.items[:]
+            random.shuffle(self._bag)
+            # The next pick comes from the end; don't let a refill repeat the last result
+            if len(self._bag) > 1 and self._bag[-1] == self._last:
+                self._bag[0], self._bag[-1] = self._bag[-1], self._bag[0]
+        self._last = self._bag.pop()
+        return self._last
+
+class TokenBucket:
+    """Allows `rate` uses per `per` seconds, refilled lazily so each check is O(1)."""
+    def __init__(self, rate, per):
+        self.rate = rate
+        self.per = per
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+        self.updated = now
+        return self.tokens >= 1
+
+    @property
+    def full(self):
+        return self.tokens >= self.rate
+
 class Fun(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.config_path = os.path.join(os.path.dirname(__file__), '../data/fun_commands.json')
+        self.registry = {}  # command name -> ShuffleBag of responses
+        self._registered = set()  # Names this cog added to the bot
+        self.cooldowns = DEFAULT_COOLDOWNS
+        self._buckets = {}  # ("channel" | "user", id) -> TokenBucket
+        self._next_sweep = time.monotonic()
 
-    @commands.command()
-    async def hello(self, ctx):
-        await ctx.send("Hello gamer! 🎮")
+    async def cog_load(self):
+        try:
+            self.load_config()
+        except FunConfigError as e:
+            # Don't block startup on a broken data file; fix it and use !reloadfun
+            logging.warning(f"Failed to load fun commands: {e}")
+        self.register_commands()
 
-    @commands.command()
-    async def dave(self, ctx):
-        await ctx.send("Now, Dave. I'm afraid I can't do that.")
+    async def cog_unload(self):
+        self.unregister_commands()
 
-    @commands.command()
-    async def mmn(self, ctx):
-        await ctx.send("🤓 Eugene 🤓")
-    
-    @commands.command()
-    async def bnuuy(self, ctx):
-        bunny_gifs = [
-        "https://tenor.com/JBF3fq5wKL.gif",
-        "https://tenor.com/view/bunny-cute-bun-rabbit-dance-gif-12204421675478327501",
-        "https://tenor.com/view/bunny-eating-gif-27018618",
-        "https://tenor.com/view/albert-harebrayne-bunny-rabbit-gif-10500821922776666435",
-        "https://tenor.com/view/bunny-kissing-dog-bunny-dog-kissing-puppy-gif-10364923600939704626",
-    ]
-        gif = random.choice(bunny_gifs)
-        await ctx.send(gif)
+    def load_config(self):
+        """
+        Read response commands from the data file into the precompiled registry.
+
+        Raises FunConfigError if the file is missing or malformed; nothing is assigned
+        in that case, so a bad hot reload keeps the current registry.
+        """
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError as e:
+            raise FunConfigError(f"file not found: {self.config_path}") from e
+        except json.JSONDecodeError as e:
+            raise FunConfigError(f"invalid JSON: {e}") from e
+        if not isinstance(data, dict):
+            raise FunConfigError("top level must be an object")
+
+        entries = data.get('commands', {})
+        if not isinstance(entries, dict):
+            raise FunConfigError("'commands' must be an object")
+        registry = {}
+        for name, entry in entries.items():
+            responses = entry.get('responses') if isinstance(entry, dict) else None
+            if (not isinstance(responses, list) or not responses
+                    or not all(isinstance(r, str) for r in responses)):
+                raise FunConfigError(f"'{name}' needs a non-empty 'responses' list of strings")
+            registry[name.lower()] = ShuffleBag(responses)
+
+        overrides = data.get('cooldowns', {})
+        if not isinstance(overrides, dict):
+            raise FunConfigError("'cooldowns' must be an object")
+        cooldowns = {}
+        for scope, limits in DEFAULT_COOLDOWNS.items():
+            override = overrides.get(scope, {})
+            if not isinstance(override, dict):
+                raise FunConfigError(f"'cooldowns.{scope}' must be an object")
+            cooldowns[scope] = {**limits, **override}
+            for field in ('rate', 'per'):
+                value = cooldowns[scope][field]
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                    raise FunConfigError(f"'cooldowns.{scope}.{field}' must be a positive number")
+            # Buckets hold at most `rate` tokens and each use needs a whole one
+            if cooldowns[scope]['rate'] < 1:
+                raise FunConfigError(f"'cooldowns.{scope}.rate' must be at least 1")
+
+        self.registry, self.cooldowns, self._buckets = registry, cooldowns, {}
+
+    def register_commands(self):
+        for name in self.registry:
+            if self.bot.get_command(name) is not None:
+                logging.warning(f"Skipping fun command '{name}': name already in use")
+                continue
+            self.bot.add_command(commands.Command(self._make_callback(name), name=name))
+            self._registered.add(name)
+
+    def unregister_commands(self):
+        for name in self._registered:
+            self.bot.remove_command(name)
+        self._registered.clear()
+
+    def _make_callback(self, name):
+        async def callback(ctx):
+            if not self._allow(ctx):
+                return  # Rate limited: drop silently so spam never reaches the API
+            await ctx.send(self.registry[name].pick())
+        return callback
+
+    def _allow(self, ctx):
+        """Check the channel and user token buckets, consuming from both only if both have a token."""
+        self._sweep_buckets()
+        buckets = []
+        for scope, key in (("channel", ctx.channel.id), ("user", ctx.author.id)):
+            bucket = self._buckets.get((scope, key))
+            if bucket is None:
+                limits = self.cooldowns[scope]
+                bucket = self._buckets[(scope, key)] = TokenBucket(limits['rate'], limits['per'])
+            if not bucket.refill():
+                return False
+            buckets.append(bucket)
+        for bucket in buckets:
+            bucket.tokens -= 1
+        return True
+
+    def _sweep_buckets(self):
+        """Drop buckets that have refilled completely; a fresh bucket behaves the same."""
+        now = time.monotonic()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + max(limits['per'] for limits in self.cooldowns.values())
+        for key, bucket in list(self._buckets.items()):
+            bucket.refill()
+            if bucket.full:
+                del self._buckets[key]
 
     @commands.command()
-    async def mothman(self, ctx):
-        mothtwerk = "https://art.ngfiles.com/images/3435000/3435336_codingcanine_thicc-mothman.gif"
-        await ctx.send(mothtwerk)
+    @commands.has_permissions(administrator=True)
+    async def reloadfun(self, ctx):
+        """Reload response commands from data/fun_commands.json without restarting."""
+        try:
+            self.load_config()
+        except FunConfigError as e:
+            await ctx.send(f"❌ Failed to reload fun commands: {e}", delete_after=10)
+            return
+        self.unregister_commands()
+        self.register_commands()
+        await ctx.send(f"✅ Reloaded {len(self._registered)} fun commands!", delete_after=10)
 
 
 async def setup(bot):
-    await bot.add_cog(Fun(bot))
\ No newline at end of file
+    await bot.add_cog(Fun(bot))
@@ -4,7 +4,10 @@ import json
 import os
 import logging
 import asyncio
-from modules.utils import get_random_color
+import time
+from modules.utils import get_random_color, in_flight
+
+APPROVAL_TIMEOUT = 43200  # 12 hours
 
 class RolePicker(commands.Cog):
     def __init__(self, bot):
@@ -13,6 +16,12 @@ class RolePicker(commands.Cog):
         self.load_config()
         self._bot_removing_reactions = set()  # (user_id, message_id, emoji_str)
         self._reactions_lock = asyncio.Lock()  # Protect access to _bot_removing_reactions
+        self._picker_message = None  # Cached handle to the rolepicker message
+        self._pending_approvals = {}  # request_msg_id -> {guild_id, member_id, channel_id, deadline}
+        self._approval_tasks = set()  # Keeps re-armed approval waits alive
+        # Approvals still pending at the last shutdown, re-armed once the bot is ready
+        warm_state = getattr(bot, 'warm_state', {}).get(self.qualified_name, {})
+        self._restored_approvals = warm_state.get('pending_approvals') or None
 
     def load_config(self):
         try:
@@ -38,6 +47,26 @@ class RolePicker(commands.Cog):
                 "embed_title": "Pick Your Role!",
                 "roles": []
             }
+        self._build_routing()
+
+    def _build_routing(self):
+        """Precompile emoji -> role entry lookups (custom emoji by ID, Unicode by string)."""
+        self._routing = {}
+        for entry in self.config['roles']:
+            entry_emoji = entry['emoji']
+            # Custom emoji: <a:name:id> or <:name:id>
+            if entry_emoji.startswith('<:') or entry_emoji.startswith('<a:'):
+                try:
+                    self._routing.setdefault(int(entry_emoji.split(':')[2][:-1]), entry)
+                except (IndexError, ValueError):
+                    continue
+            else:
+                self._routing.setdefault(entry_emoji, entry)
+
+    def snapshot_state(self):
+        """Warm state to carry over a restart (see save_warm_state in modules.utils)."""
+        # Include restored approvals not re-armed yet (exit before on_ready), or they'd be lost
+        return {"pending_approvals": {**(self._restored_approvals or {}), **self._pending_approvals}}
 
     @commands.command()
     async def rolepicker(self, ctx):
@@ -46,31 +75,11 @@ class RolePicker(commands.Cog):
             await ctx.message.delete()
         except (discord.Forbidden, discord.HTTPException, discord.NotFound):
             pass  # Bot lacks permissions or message already deleted
-        # Build description listing all roles
-        desc_lines = []
-        for entry in self.config['roles']:
-            approval = " (Admin Approval Required)" if entry.get('admin_approval') else ""
-            desc_lines.append(f"{entry['emoji']} — {entry['description']}{approval}")
-        description = "\n".join(desc_lines)
-        
-        # Determine color following the pattern from events module
-        if "color" in self.config and hasattr(discord.Color, self.config["color"]):
-            color_value = getattr(discord.Color, self.config["color"])()
-        else:
-            color_value = get_random_color()
-        
-        embed = discord.Embed(
-            title=self.config.get('embed_title', 'Pick Your Role!'),
-            description=description,
-            color=color_value
-        )
-        if 'embed_image' in self.config:
-            embed.set_image(url=self.config['embed_image'])
-        if 'embed_footer' in self.config:
-            embed.set_footer(text=self.config['embed_footer'])
+        embed = self._build_embed()
         msg = await ctx.send(embed=embed)
         self.config['message_id'] = msg.id
         self.config['channel_id'] = msg.channel.id
+        self._picker_message = msg
         try:
             with open(self.config_path, 'w', encoding='utf-8') as f:
                 json.dump(self.config, f, indent=2)
@@ -106,27 +115,19 @@ class RolePicker(commands.Cog):
             return
         if role_entry.get('admin_approval'):
             # Remove user's reaction immediately
-            channel = self.bot.get_channel(self.config['channel_id'])
-            msg = await channel.fetch_message(self.config['message_id'])
-            key = (member.id, msg.id, str(payload.emoji))
-            async with self._reactions_lock:
-                self._bot_removing_reactions.add(key)
-            await msg.remove_reaction(payload.emoji, member)
+            with in_flight(self.bot):
+                await self._remove_user_reaction(payload, member)
             # Start admin approval flow
             await self._handle_admin_approval(payload, member, role_entry)
         else:
-            if role in member.roles:
-                await member.remove_roles(role, reason="RolePicker toggle off")
-                await self._notify_user(member, f"The role {role.name} has been removed from you.")
-            else:
-                await member.add_roles(role, reason="RolePicker reaction add")
-                await self._notify_user(member, f"You have been given the role: {role.name}")
-            channel = self.bot.get_channel(self.config['channel_id'])
-            msg = await channel.fetch_message(self.config['message_id'])
-            key = (member.id, msg.id, str(payload.emoji))
-            async with self._reactions_lock:
-                self._bot_removing_reactions.add(key)
-            await msg.remove_reaction(payload.emoji, member)
+            with in_flight(self.bot):
+                if role in member.roles:
+                    await member.remove_roles(role, reason="RolePicker toggle off")
+                    await self._notify_user(member, f"The role {role.name} has been removed from you.")
+                else:
+                    await member.add_roles(role, reason="RolePicker reaction add")
+                    await self._notify_user(member, f"You have been given the role: {role.name}")
+                await self._remove_user_reaction(payload, member)
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload):
@@ -154,8 +155,63 @@ class RolePicker(commands.Cog):
         # (it's removed by the bot immediately on add)
         if not role_entry.get('admin_approval'):
             if role in member.roles:
-                await member.remove_roles(role, reason="RolePicker reaction remove")
-                await self._notify_user(member, f"The role {role.name} has been removed from you.")
+                with in_flight(self.bot):
+                    await member.remove_roles(role, reason="RolePicker reaction remove")
+                    await self._notify_user(member, f"The role {role.name} has been removed from you.")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        """Re-arm admin approvals that were still pending at the last shutdown."""
+        if self._restored_approvals is None:
+            return
+        restored, self._restored_approvals = self._restored_approvals, None
+        for request_id, info in restored.items():
+            guild = self.bot.get_guild(info['guild_id'])
+            channel = self.bot.get_channel(info['channel_id'])
+            member = guild.get_member(info['member_id']) if guild else None
+            if channel is None:
+                # Admin channel not visible right now; keep the request for the next
+                # snapshot until its deadline passes
+                if info['deadline'] > time.time():
+                    self._pending_approvals[int(request_id)] = info
+                else:
+                    logging.warning(f"Dropping expired approval request {request_id}: admin channel not found")
+                continue
+            request_msg = channel.get_partial_message(int(request_id))
+            if member is None:
+                # Requester left the server while the bot was down
+                try:
+                    await request_msg.edit(content="Request cancelled: the member is no longer in the server.")
+                except (discord.Forbidden, discord.HTTPException, discord.NotFound):
+                    pass  # Request message deleted or bot lacks permissions
+                user = self.bot.get_user(info['member_id'])
+                if user is not None:
+                    await self._notify_user(user, "Your D&D role request was cancelled because you are no longer in the server.")
+                continue
+            self._pending_approvals[request_msg.id] = info
+            task = asyncio.create_task(self._await_admin_decision(request_msg, member, info['deadline']))
+            self._approval_tasks.add(task)
+            task.add_done_callback(self._approval_tasks.discard)
+
+    def _get_picker_message(self):
+        """Return a handle to the rolepicker message without fetching it over REST."""
+        message_id = self.config.get('message_id')
+        if self._picker_message is None or self._picker_message.id != message_id:
+            channel = self.bot.get_channel(self.config.get('channel_id'))
+            if channel is None:
+                return None
+            self._picker_message = channel.get_partial_message(message_id)
+        return self._picker_message
+
+    async def _remove_user_reaction(self, payload, member):
+        """Remove a user's reaction from the picker without triggering the remove handler."""
+        msg = self._get_picker_message()
+        if msg is None:
+            return
+        key = (member.id, msg.id, str(payload.emoji))
+        async with self._reactions_lock:
+            self._bot_removing_reactions.add(key)
+        await msg.remove_reaction(payload.emoji, member)
 
     def _is_rolepicker_message(self, payload):
         return (
@@ -165,22 +221,11 @@ class RolePicker(commands.Cog):
 
     def _get_role_entry(self, emoji):
         # emoji: discord.PartialEmoji or str
-        for entry in self.config['roles']:
-            entry_emoji = entry['emoji']
-            # Custom emoji: <a:name:id> or <:name:id>
-            if entry_emoji.startswith('<:') or entry_emoji.startswith('<a:'):
-                # Extract ID
-                try:
-                    entry_id = int(entry_emoji.split(':')[2][:-1])
-                except Exception:
-                    continue
-                if hasattr(emoji, 'id') and emoji.id == entry_id:
-                    return entry
-            else:
-                # Unicode emoji
-                if (hasattr(emoji, 'name') and emoji.name == entry_emoji) or (str(emoji) == entry_emoji):
-                    return entry
-        return None
+        emoji_id = getattr(emoji, 'id', None)
+        if emoji_id is not None:
+            return self._routing.get(emoji_id)
+        # Unicode emoji
+        return self._routing.get(getattr(emoji, 'name', None)) or self._routing.get(str(emoji))
 
     def _emoji_matches(self, emoji_str, reaction_emoji):
         """Helper to check if a configured emoji string matches a Discord reaction emoji."""
@@ -198,80 +243,101 @@ class RolePicker(commands.Cog):
     async def _handle_admin_approval(self, payload, member, role_entry, add=True):
         """Handle D&D role approval flow with admin reactions."""
         _ = add  # Reserved for future use
-        admin_channel_id = self.config.get('admin_channel_id')
-        if not admin_channel_id:
-            return
-        admin_channel = self.bot.get_channel(admin_channel_id)
-        if not admin_channel:
-            print(f"Warning: Admin channel {admin_channel_id} not found")
-            await self._notify_user(member, "Your request could not be processed. Please contact an administrator.")
-            return
+        with in_flight(self.bot):
+            admin_channel_id = self.config.get('admin_channel_id')
+            if not admin_channel_id:
+                return
+            admin_channel = self.bot.get_channel(admin_channel_id)
+            if not admin_channel:
+                print(f"Warning: Admin channel {admin_channel_id} not found")
+                await self._notify_user(member, "Your request could not be processed. Please contact an administrator.")
+                return
 
-        # Send DM to user that request is pending
-        await self._notify_user(member, "Your request for D&D access is pending administrator approval.")
-        
-        # Send admin channel message
-        embed = discord.Embed(
-            title="Role Approval Needed",
-            description=f"User: {member.mention}\nRequest: D&D access\nReact below to approve as Player, Spectator, or Deny.",
-            color=discord.Color.gold()
-        )
-        request_msg = await admin_channel.send(embed=embed)
-        
-        player_emoji_str = "<:DnD:858802171193327616>"
-        spectator_emoji_str = "<:dndspec:1462113193051553799>"
-        await request_msg.add_reaction(player_emoji_str)
-        await request_msg.add_reaction(spectator_emoji_str)
-        await request_msg.add_reaction("❌")  # Deny
-        
-        def check(reaction, user):
+            # Send DM to user that request is pending
+            await self._notify_user(member, "Your request for D&D access is pending administrator approval.")
+            
+            # Send admin channel message
+            embed = discord.Embed(
+                title="Role Approval Needed",
+                description=f"User: {member.mention}\nRequest: D&D access\nReact below to approve as Player, Spectator, or Deny.",
+                color=discord.Color.gold()
+            )
+            request_msg = await admin_channel.send(embed=embed)
+            
+            player_emoji_str = "<:DnD:858802171193327616>"
+            spectator_emoji_str = "<:dndspec:1462113193051553799>"
+            await request_msg.add_reaction(player_emoji_str)
+            await request_msg.add_reaction(spectator_emoji_str)
+            await request_msg.add_reaction("❌")  # Deny
+
+            # Track the request so it survives a restart (see snapshot_state)
+            deadline = time.time() + APPROVAL_TIMEOUT
+            self._pending_approvals[request_msg.id] = {
+                "guild_id": member.guild.id,
+                "member_id": member.id,
+                "channel_id": admin_channel.id,
+                "deadline": deadline
+            }
+
+        # Waiting on admins is not in-flight work; shutdown snapshots it instead
+        await self._await_admin_decision(request_msg, member, deadline)
+
+    async def _await_admin_decision(self, request_msg, member, deadline):
+        """Wait for an admin to react on an approval request and apply the decision."""
+        def check(decision):
             return (
-                reaction.message.id == request_msg.id and
+                decision.message_id == request_msg.id and
+                decision.user_id != self.bot.user.id and
                 (
-                    (hasattr(reaction.emoji, 'id') and str(reaction.emoji.id) == "858802171193327616") or
-                    (hasattr(reaction.emoji, 'id') and str(reaction.emoji.id) == "1462113193051553799") or
-                    (str(reaction.emoji) == "❌")
+                    (decision.emoji.id is not None and str(decision.emoji.id) == "858802171193327616") or
+                    (decision.emoji.id is not None and str(decision.emoji.id) == "1462113193051553799") or
+                    (str(decision.emoji) == "❌")
                 ) and
-                user.guild_permissions.administrator
+                decision.member is not None and
+                decision.member.guild_permissions.administrator
             )
         
+        # Raw events so requests restored after a restart (not in the message cache) still resolve
         try:
-            reaction, user = await self.bot.wait_for('reaction_add', check=check, timeout=43200)  # 12 hours
+            decision = await self.bot.wait_for('raw_reaction_add', check=check, timeout=max(0, deadline - time.time()))
         except asyncio.TimeoutError:
+            self._pending_approvals.pop(request_msg.id, None)
             await request_msg.edit(content="Request timed out after 12 hours.")
             await self._notify_user(member, "Your D&D role request timed out after 12 hours. Please request again if still needed.")
             return
-        
-        # Remove all reactions from admin message after decision
-        try:
-            await request_msg.clear_reactions()
-        except (discord.Forbidden, discord.HTTPException):
-            pass  # Bot may lack permissions
-        
-        if hasattr(reaction.emoji, 'id') and str(reaction.emoji.id) == "858802171193327616":
-            # Approve as Player
-            player_role_id = 957848615173378108
-            role = member.guild.get_role(player_role_id)
-            if role:
-                await member.add_roles(role, reason="Admin approved D&D Player")
-                await self._notify_user(member, "Your request for D&D Player was approved!")
-                await request_msg.edit(content="Request approved as Player.")
-            else:
-                await request_msg.edit(content="Configuration error: Player role not found.")
-        elif hasattr(reaction.emoji, 'id') and str(reaction.emoji.id) == "1462113193051553799":
-            # Approve as Spectator
-            spectator_role_id = 809223517949919272
-            role = member.guild.get_role(spectator_role_id)
-            if role:
-                await member.add_roles(role, reason="Admin approved D&D Spectator")
-                await self._notify_user(member, "Your request for D&D Spectator was approved!")
-                await request_msg.edit(content="Request approved as Spectator.")
+        self._pending_approvals.pop(request_msg.id, None)
+
+        with in_flight(self.bot):
+            # Remove all reactions from admin message after decision
+            try:
+                await request_msg.clear_reactions()
+            except (discord.Forbidden, discord.HTTPException):
+                pass  # Bot may lack permissions
+            
+            if decision.emoji.id is not None and str(decision.emoji.id) == "858802171193327616":
+                # Approve as Player
+                player_role_id = 957848615173378108
+                role = member.guild.get_role(player_role_id)
+                if role:
+                    await member.add_roles(role, reason="Admin approved D&D Player")
+                    await self._notify_user(member, "Your request for D&D Player was approved!")
+                    await request_msg.edit(content="Request approved as Player.")
+                else:
+                    await request_msg.edit(content="Configuration error: Player role not found.")
+            elif decision.emoji.id is not None and str(decision.emoji.id) == "1462113193051553799":
+                # Approve as Spectator
+                spectator_role_id = 809223517949919272
+                role = member.guild.get_role(spectator_role_id)
+                if role:
+                    await member.add_roles(role, reason="Admin approved D&D Spectator")
+                    await self._notify_user(member, "Your request for D&D Spectator was approved!")
+                    await request_msg.edit(content="Request approved as Spectator.")
+                else:
+                    await request_msg.edit(content="Configuration error: Spectator role not found.")
             else:
-                await request_msg.edit(content="Configuration error: Spectator role not found.")
-        else:
-            # Denied
-            await request_msg.edit(content="Request denied.")
-            await self._notify_user(member, "Your D&D role request was denied by an admin.")
+                # Denied
+                await request_msg.edit(content="Request denied.")
+                await self._notify_user(member, "Your D&D role request was denied by an admin.")
 
     async def _notify_user(self, member, message):
         """Attempt to send a DM to the user. Silently fails if user has DMs disabled or other send errors occur."""
@@ -316,6 +382,7 @@ class RolePicker(commands.Cog):
             "admin_approval": admin_approval
         }
         self.config['roles'].append(new_entry)
+        self._build_routing()
         
         # Save config
         try:
@@ -327,9 +394,11 @@ class RolePicker(commands.Cog):
         
         # Update the embed if it exists
         if 'message_id' in self.config and 'channel_id' in self.config:
-            await self._update_rolepicker_embed(ctx)
+            saved = await self._update_rolepicker_embed(ctx)
+            if saved is None:
+                return
             approval_text = " (requires admin approval)" if admin_approval else ""
-            await ctx.send(f"✅ Added {emoji} {role.mention} to rolepicker{approval_text}!", delete_after=10)
+            await ctx.send(f"✅ Added {emoji} {role.mention} to rolepicker{approval_text}! ({saved} API calls saved)", delete_after=10)
         else:
             await ctx.send(f"✅ Added {emoji} {role.mention} to config. Use `!rolepicker` to post the embed.", delete_after=10)
 
@@ -370,6 +439,7 @@ class RolePicker(commands.Cog):
         if not removed:
             await ctx.send(f"❌ Could not find a role matching `{identifier}` in the rolepicker!", delete_after=10)
             return
+        self._build_routing()
         
         # Save config
         try:
@@ -381,8 +451,10 @@ class RolePicker(commands.Cog):
         
         # Update the embed if it exists
         if 'message_id' in self.config and 'channel_id' in self.config:
-            await self._update_rolepicker_embed(ctx)
-            await ctx.send(f"✅ Removed role from rolepicker!", delete_after=10)
+            saved = await self._update_rolepicker_embed(ctx)
+            if saved is None:
+                return
+            await ctx.send(f"✅ Removed role from rolepicker! ({saved} API calls saved)", delete_after=10)
         else:
             await ctx.send(f"✅ Removed role from config.", delete_after=10)
 
@@ -405,62 +477,127 @@ class RolePicker(commands.Cog):
         # Reload config from file in case it was edited manually
         self.load_config()
         
-        await self._update_rolepicker_embed(ctx)
-        await ctx.send("✅ Rolepicker embed updated!", delete_after=10)
+        saved = await self._update_rolepicker_embed(ctx)
+        if saved is None:
+            return
+        await ctx.send(f"✅ Rolepicker embed updated! ({saved} API calls saved)", delete_after=10)
+
+    def _build_embed(self, fallback_color=None):
+        """Render the rolepicker embed from the current config.
+
+        If no valid color is configured, ``fallback_color`` is used when given
+        (so a refresh keeps the color already posted), otherwise a random one.
+        """
+        # Build description listing all roles
+        desc_lines = []
+        for entry in self.config['roles']:
+            approval = " (Admin Approval Required)" if entry.get('admin_approval') else ""
+            desc_lines.append(f"{entry['emoji']} — {entry['description']}{approval}")
+        description = "\n".join(desc_lines)
+
+        # Determine color following the pattern from events module
+        if "color" in self.config and hasattr(discord.Color, self.config["color"]):
+            color_value = getattr(discord.Color, self.config["color"])()
+        elif fallback_color is not None:
+            color_value = fallback_color
+        else:
+            color_value = get_random_color()
+
+        embed = discord.Embed(
+            title=self.config.get('embed_title', 'Pick Your Role!'),
+            description=description,
+            color=color_value
+        )
+        if 'embed_image' in self.config:
+            embed.set_image(url=self.config['embed_image'])
+        if 'embed_footer' in self.config:
+            embed.set_footer(text=self.config['embed_footer'])
+        return embed
+
+    @staticmethod
+    def _embed_signature(embed):
+        """Return the parts of an embed the rolepicker controls, for comparison."""
+        color = embed.color.value if embed.color is not None else None
+        return (embed.title, embed.description, color, embed.image.url, embed.footer.text)
 
     async def _update_rolepicker_embed(self, ctx):
-        """Update the existing rolepicker message with current config."""
+        """
+        Update the existing rolepicker message with current config.
+
+        Only touches what changed: the embed is edited only if its rendered
+        content differs from the posted one, and reactions are diffed against
+        the configured emojis instead of being cleared and re-added.
+        Returns the number of API calls saved compared to a full refresh
+        (one edit, one clear and one add per role), or None on failure.
+        """
         try:
             channel = self.bot.get_channel(self.config['channel_id'])
             if not channel:
                 await ctx.send("❌ Rolepicker channel not found!", delete_after=10)
-                return
+                return None
             
             message = await channel.fetch_message(self.config['message_id'])
             if not message:
                 await ctx.send("❌ Rolepicker message not found!", delete_after=10)
-                return
-            
-            # Build description listing all roles
-            desc_lines = []
-            for entry in self.config['roles']:
-                approval = " (Admin Approval Required)" if entry.get('admin_approval') else ""
-                desc_lines.append(f"{entry['emoji']} — {entry['description']}{approval}")
-            description = "\n".join(desc_lines)
-            
-            # Determine color following the pattern from events module
-            if "color" in self.config and hasattr(discord.Color, self.config["color"]):
-                color_value = getattr(discord.Color, self.config["color"])()
-            else:
-                color_value = get_random_color()
-            
-            embed = discord.Embed(
-                title=self.config.get('embed_title', 'Pick Your Role!'),
-                description=description,
-                color=color_value
-            )
-            if 'embed_image' in self.config:
-                embed.set_image(url=self.config['embed_image'])
-            if 'embed_footer' in self.config:
-                embed.set_footer(text=self.config['embed_footer'])
-            
-            await message.edit(embed=embed)
-            
-            # Clear and re-add all reactions
-            try:
-                await message.clear_reactions()
-            except (discord.Forbidden, discord.HTTPException):
-                pass  # Bot may lack permissions
-            
-            for entry in self.config['roles']:
+                return None
+
+            calls = 0
+            current = message.embeds[0] if message.embeds else None
+            embed = self._build_embed(fallback_color=current.color if current else None)
+            if current is None or self._embed_signature(current) != self._embed_signature(embed):
+                await message.edit(embed=embed)
+                calls += 1
+
+            roles = self.config['roles']
+            stale = [
+                r for r in message.reactions
+                if not any(self._emoji_matches(entry['emoji'], r.emoji) for entry in roles)
+            ]
+            present = [
+                entry for entry in roles
+                if any(r.me and self._emoji_matches(entry['emoji'], r.emoji) for r in message.reactions)
+            ]
+
+            # Stray user reactions pile up over time; once clearing them one by one would
+            # cost strictly more than a full clear + re-add, reset the reactions instead.
+            # This also removes users' reactions on configured emojis.
+            cleared_all = False
+            if len(stale) > len(present) + 1:
+                try:
+                    await message.clear_reactions()
+                    calls += 1
+                    present = []
+                    cleared_all = True
+                except (discord.Forbidden, discord.HTTPException):
+                    pass  # Bot may lack permissions; clear stale emojis one by one below
+            if not cleared_all:
+                # Clear reactions whose emoji is no longer configured (all users at once)
+                for reaction in stale:
+                    try:
+                        await message.clear_reaction(reaction.emoji)
+                        calls += 1
+                    except (discord.Forbidden, discord.HTTPException, discord.NotFound):
+                        pass  # Bot may lack permissions
+
+            # Add the bot's reaction only for configured emojis it hasn't reacted with yet
+            for entry in roles:
+                if entry in present:
+                    continue
                 try:
                     await message.add_reaction(entry['emoji'])
+                    calls += 1
                 except (discord.Forbidden, discord.HTTPException, discord.NotFound):
                     # Ignore failures to add reactions (invalid emoji, missing permissions, etc.)
                     pass
+
+            # The fallback path never exceeds the old edit + clear + N adds, but clamp anyway
+            saved = max(0, 2 + len(roles) - calls)
+            logging.info(f"Rolepicker refresh made {calls} API calls ({saved} saved)")
+            return saved
         
         except (discord.NotFound, discord.HTTPException) as e:
             await ctx.send(f"❌ Failed to update rolepicker: {e}", delete_after=10)
+            return None
 
 async def setup(bot):
     await bot.add_cog(RolePicker(bot))
@@ -1,5 +1,11 @@
 import random
 import discord
+import json
+import os
+import time
+import asyncio
+import logging
+from contextlib import contextmanager
 
 # Shared D&D data
 alignments = (
@@ -26,3 +32,62 @@ async def msgdel(ctx):
 
 def get_random_color():
     return getattr(discord.Color, random.choice(disc_colors))()
+
+# +--------------------+
+# |  WARM-START STATE  |
+# +--------------------+
+
+WARM_STATE_PATH = os.path.join(os.path.dirname(__file__), '../data/warm_state.json')
+
+def load_warm_state():
+    """Load and consume the snapshot written on the last shutdown. Returns {cog_name: state}."""
+    try:
+        with open(WARM_STATE_PATH, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError as e:
+        logging.warning(f"Ignoring corrupted warm-start snapshot: {e}")
+        snapshot = {}
+    # Consume the snapshot so a later crash can't replay stale state
+    try:
+        os.remove(WARM_STATE_PATH)
+    except OSError:
+        pass
+    return snapshot.get('cogs', {})
+
+def save_warm_state(bot):
+    """Write a snapshot of every cog that implements snapshot_state()."""
+    cogs = {}
+    for name, cog in bot.cogs.items():
+        snapshot_state = getattr(cog, 'snapshot_state', None)
+        if snapshot_state is not None:
+            cogs[name] = snapshot_state()
+    try:
+        os.makedirs(os.path.dirname(WARM_STATE_PATH), exist_ok=True)
+        with open(WARM_STATE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({"saved_at": time.time(), "cogs": cogs}, f, indent=2)
+    except (IOError, OSError, PermissionError) as e:
+        logging.warning(f"Failed to save warm-start snapshot: {e}")
+
+@contextmanager
+def in_flight(bot):
+    """Mark the current task as in-flight work that shutdown should wait for."""
+    tracked = getattr(bot, 'in_flight', None)
+    if tracked is None:
+        # Bot without in-flight tracking (see bot.py); nothing to record
+        yield
+        return
+    task = asyncio.current_task()
+    tracked.add(task)
+    try:
+        yield
+    finally:
+        tracked.discard(task)
+
+async def drain_in_flight(bot, timeout=10):
+    """Wait (up to timeout seconds) for in-flight work other than the current task to finish."""
+    current = asyncio.current_task()
+    pending = [task for task in getattr(bot, 'in_flight', ()) if task is not current and not task.done()]
+    if pending:
+        await asyncio.wait(pending, timeout=timeout)